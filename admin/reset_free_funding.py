@@ -1,4 +1,3 @@
-import logging
 import path
 import sys
 
@@ -9,13 +8,10 @@ sys.path.append(directory.parent.parent)
 
 from bot.utils.db_utils import DBUtil
 from bot.config.const import FREE_FUNDING_LIMIT_PERSON_PER_SEASON
-from bot.config.logging_config import log_handler, console_handler, DEFAULT_LOG_LEVEL
+from bot.config.logging_config import get_logger
 from bot.config.schemas import FreeFundingBalance
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 
 def reset_all_free_funding_balances():
@@ -51,6 +51,11 @@ FREE_FUNDING_LIMIT_PERSON_PER_SEASON = 3000
 ROLE_IDS_ALLOWED = (1063903240925749389,)
 VOTING_CHANNEL_ID = 1067119414731886645
 GRANT_APPLY_CHANNEL_ID = 1067127829654937692
+# The channels where the reactions of users who voted on a wrong message (the proposer message or the
+#  bot reply to it) are removed. These are the channels where proposals are submitted, and the bot
+#  needs the permission to manage messages there. The cleanup is disabled while the set is empty
+#  (the voting channel isn't listed, because proposals can't be submitted there)
+CHANNELS_TO_REMOVE_HELPER_MESSAGES_AND_REACTIONS = frozenset()
 
 # =====================
 # Bot related constants
@@ -66,6 +71,17 @@ APPROVAL_SLEEP_SECONDS = 5
 #  Recommended value based on observations - 5-10 sec. During this time (as well as while recovery runs),
 #  the bot will reject all proposals and votes for the sake of data integrity.
 SLEEP_BEFORE_RECOVERY_SECONDS = 7
+# Time interval during which the added votes are collected in order to be saved to DB with a single
+#  commit (so that a burst of votes isn't committed one by one)
+VOTES_COMMIT_DELAY_SECONDS = 0.05
+# The number of workers that handle the reactions on proposals, and the maximal number of reactions
+#  waiting to be handled (when the queue is full, the next reactions wait for a free slot).
+#  The workers don't wait for the delayed commit of a vote, otherwise a commit could never save more
+#  votes than there are workers, and each vote would hold its worker for the whole delay. The
+#  trade-off is that a vote is only kept in memory until the commit (if the bot stops meanwhile, the
+#  vote is restored from the reactions on recovery), and an error of the commit is only logged
+VOTE_WORKERS_COUNT = 4
+VOTE_QUEUE_MAX_SIZE = 1024
 
 DISCORD_COMMAND_PREFIX = "!"
 GRANT_PROPOSAL_COMMAND_NAME = 'propose'
@@ -134,33 +150,36 @@ REACTION_ON_TRANSACTION_FAILED = "❌"  # red cross
 
 # Other emoji
 EMOJI_HOORAY = "🎉"
-HEART_EMOJI_LIST = [
-    "❤️",
-    "♥️",
-    "🖤",
-    "💙",
-    "🤎",
-    "💝",
-    "💚",
-    "🧡",
-    "💜",
-    "💞",
-    "🥰",
-    "💖",
-    "💕",
-    "🤍",
-    "💛",
-    "💓",
-    "💗",
-    "💘",
-    "💌",
-    "😍",
-    "❣️",
-    "😻",
-    "🫶",
-    "❤️‍🔥",
-    "😘",
-]
+# A set for quick lookups on each reaction
+HEART_EMOJIS = frozenset(
+    {
+        "❤️",
+        "♥️",
+        "🖤",
+        "💙",
+        "🤎",
+        "💝",
+        "💚",
+        "🧡",
+        "💜",
+        "💞",
+        "🥰",
+        "💖",
+        "💕",
+        "🤍",
+        "💛",
+        "💓",
+        "💗",
+        "💘",
+        "💌",
+        "😍",
+        "❣️",
+        "😻",
+        "🫶",
+        "❤️‍🔥",
+        "😘",
+    }
+)
 
 
 # ==============
@@ -264,7 +283,7 @@ For questions, ideas or partnership, reach out to {RESPONSIBLE_MENTION}. The pro
 """
 HELP_MESSAGE_VOTED_INCORRECTLY = "Oops, looks like you're trying to vote, but on a wrong message! 😕 To make your vote count, please head to the voting message in #l3-voting: {voting_link}."
 HELP_MESSAGE_VOTED_AGAINST = """
-Your vote against a proposal of {author} has been counted. The voting ends {countdown}. Make sure to explain why you're against it, be clear, concise and respectful.
+Your vote against a proposal of {author} has been counted. The voting ends <t:{closed_at_timestamp}:R>. Make sure to explain why you're against it, be clear, concise and respectful.
 If you change your mind after talking to the author, remember to remove {cancel_emoji} from {voting_link}.
 """
 HELP_MESSAGE_REMOVED_FROM_VOTING_CHANNEL = "Hi there! Your message was removed from `#l3-voting`, because it was decided to leave the channel opened only for messages by bots (for example, EasyPoll can write there too, but not humans). This is to maintain the channel cleaner, so others can simply see all active votings. Please use `#l3-general` or other channels to post your message. The decision was made here: https://discord.com/channels/768556386404794448/1060864279303172136/1077580065648427060"
@@ -17,3 +17,17 @@ console_handler.setLevel(DEFAULT_LOG_LEVEL)
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 console_handler.setFormatter(formatter)
 log_handler.setFormatter(formatter)
+
+
+def get_logger(name):
+    """
+    Returns the logger with the given name, writing to both the log file and the console. The
+    handlers are only added once, so that they don't stack up if a module is imported again (e.g.
+    in tests), which would also duplicate each log record.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(DEFAULT_LOG_LEVEL)
+    for handler in (log_handler, console_handler):
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
+    return logger
@@ -4,6 +4,7 @@ from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy import (
     Column,
     Integer,
+    BigInteger,
     String,
     Boolean,
     DateTime,
@@ -11,6 +12,7 @@ from sqlalchemy import (
     Float,
     CheckConstraint,
     Index,
+    text,
 )
 
 from bot.config.const import (
@@ -19,23 +21,29 @@ from bot.config.const import (
     PROPOSAL_HISTORY_TABLE_NAME,
     FREE_FUNDING_TRANSACTIONS_TABLE_NAME,
     FREE_FUNDING_BALANCES_TABLE_NAME,
+    ProposalResult,
 )
 
 Base = declarative_base()
 
+# Discord ids (snowflakes) don't fit into 32 bits, so they're stored as 64-bit integers. The primary
+# keys use the same type, except in SQLite, which only autoincrements columns declared as INTEGER
+# (its integers are 64-bit anyway)
+BigIntegerPrimaryKey = BigInteger().with_variant(Integer, "sqlite")
+
 
 class Proposals(Base):
     __tablename__ = GRANT_PROPOSALS_TABLE_NAME
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigIntegerPrimaryKey, primary_key=True)
     # The id of the initial message that submitted a proposal
-    message_id = Column(Integer)
+    message_id = Column(BigInteger)
     # The id of the initial channel where the proposal was submitted
-    channel_id = Column(Integer)
+    channel_id = Column(BigInteger)
     # The id of the author of the proposal
     author = Column(String)
     # The id of the voting message in the channel VOTING_CHANNEL_ID
-    voting_message_id = Column(Integer)
+    voting_message_id = Column(BigInteger)
     # Defines whether the proposal has a grant or not
     is_grantless = Column(Boolean)
     # Mention of a user to give a grant to (empty when is_grantless is true)
@@ -50,7 +58,7 @@ class Proposals(Base):
     # Date and time when the proposal should be closed
     closed_at = Column(DateTime)
     # This is only needed for some error handling, though very helpful for onboarding new users
-    bot_response_message_id = Column(Integer)
+    bot_response_message_id = Column(BigInteger)
 
     # Reserved for later:
     # Minimal number of voters against to cancel this proposal (instead of general LAZY_CONSENSUS_THRESHOLD)
@@ -61,12 +69,14 @@ class Proposals(Base):
     cascade specifies what should happen to the related voters when the grant proposal is deleted.
     "all" means that all actions, such as deletion, will be cascaded to the related voters.
     "delete-orphan" means that any voters that no longer have a related grant proposal will be deleted from the database.
+    lazy="selectin" loads the voters of all queried proposals with one extra query, instead of a query per proposal.
     """
-    voters = relationship("Voters", back_populates="grant_proposal", cascade="all, delete-orphan")
+    voters = relationship(
+        "Voters", back_populates="grant_proposal", cascade="all, delete-orphan", lazy="selectin"
+    )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.voters = []
+    # Proposals are looked up by the voting message (e.g. when removing them)
+    __table_args__ = (Index("ix_proposals_voting_message_id", voting_message_id),)
 
     def __repr__(self):
         return f"<Proposal(id={self.id}, message_id={self.message_id}, channel_id={self.channel_id}, author={self.author}, voting_message_id={self.voting_message_id}, is_grantless={self.is_grantless}, mention={self.mention}, amount={self.amount}, description={self.description}, submitted_at={self.submitted_at}, closed_at={self.closed_at}, bot_response_message_id={self.bot_response_message_id})>"
@@ -78,13 +88,19 @@ class Voters(Base):
     """
 
     __tablename__ = VOTERS_TABLE_NAME
-    id = Column(Integer, primary_key=True)
-    user_id = Column(Integer)
-    voting_message_id = Column(Integer)
-    grant_proposal_id = Column(Integer, ForeignKey("proposals.id"))
+    id = Column(BigIntegerPrimaryKey, primary_key=True)
+    user_id = Column(BigInteger)
+    voting_message_id = Column(BigInteger)
+    grant_proposal_id = Column(BigIntegerPrimaryKey, ForeignKey("proposals.id"))
 
     grant_proposal = relationship("Proposals", back_populates="voters")
 
+    # Add indexes on the columns used to lookup voters of a proposal (including cascade deletes)
+    __table_args__ = (
+        Index("ix_voters_grant_proposal_id", grant_proposal_id),
+        Index("ix_voters_voting_message_id", voting_message_id),
+    )
+
     def __repr__(self) -> str:
         return f"<Voter(id={self.id}, user_id={self.user_id}, grant_proposal_id={self.grant_proposal_id}>"
 
@@ -106,21 +122,30 @@ class ProposalHistory(Proposals):
     __mapper_args__ = {
         'polymorphic_identity': PROPOSAL_HISTORY_TABLE_NAME,
     }
-    id = Column(Integer, ForeignKey('proposals.id'), primary_key=True)
+    id = Column(BigIntegerPrimaryKey, ForeignKey('proposals.id'), primary_key=True)
     result = Column(Integer, default=None)
     voting_message_url = Column(String)
 
-    # Add an index on the result column to optimise read query perfomance
-    __table_args__ = (Index("ix_result", result),)
+    # Add a partial index on the accepted proposals, which are the only ones that are queried (when
+    # exporting analytics), so that the index doesn't grow with the proposals of other results
+    __table_args__ = (
+        Index(
+            "ix_result_accepted",
+            result,
+            sqlite_where=text(f"result = {ProposalResult.ACCEPTED.value}"),
+            postgresql_where=text(f"result = {ProposalResult.ACCEPTED.value}"),
+        ),
+    )
 
     def __repr__(self):
-        return f"ProposalHistory(id={self.id}, message_id={self.message_id}, channel_id={self.channel_id}, author={self.author}, voting_message_id={self.voting_message_id}, is_grantless={self.is_grantless}, mention={self.mention}, amount={self.amount}, description={self.description}, submitted_at={self.submitted_at}, closed_at={self.closed_at}, bot_response_message_id={self.bot_response_message_id}, result={self.result}, voting_message_url={self.voting_message_url})"
+        # Only the key fields are included, because history items are numerous and the description may be long
+        return f"<ProposalHistory(id={self.id}, result={self.result}, closed_at={self.closed_at})>"
 
 
 class FreeFundingBalance(Base):
     __tablename__ = FREE_FUNDING_BALANCES_TABLE_NAME
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigIntegerPrimaryKey, primary_key=True)
     # The id of the user who sends transactions
     author = Column(String)
     # The nickname of the user who sends transactions (so that analytics will be retrieved quickly, without the need to query Discord for nicknames)
@@ -135,7 +160,7 @@ class FreeFundingBalance(Base):
 class FreeFundingTransaction(Base):
     __tablename__ = FREE_FUNDING_TRANSACTIONS_TABLE_NAME
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigIntegerPrimaryKey, primary_key=True)
     # The id of the user who sends transactions
     author = Column(String)
     # Comma-separated list of user mentions to whom funds were sent (the separator is defined in FREE_FUNDING_MENTIONS_COLUMN_SEPARATOR)
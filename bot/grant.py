@@ -1,21 +1,50 @@
+import asyncio
+import functools
+
 from bot.utils.proposal_utils import get_proposal, remove_proposal
 from bot.utils.db_utils import DBUtil
 from bot.config.const import *
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 from bot.utils.discord_utils import get_discord_client, get_message
 from bot.utils.formatting_utils import get_amount_to_print
 
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 db = DBUtil()
 client = get_discord_client()
 
+# The command prefix and name never change, so they're bound to the grant message template once
+format_grant_message = functools.partial(
+    GRANT_COMMAND_LAZY_CONSENSUS_MESSAGE.format,
+    prefix=DISCORD_COMMAND_PREFIX,
+    grant_command=GRANT_APPLY_COMMAND_NAME,
+)
+
+
+async def add_reactions(reactions):
+    """
+    Adds reactions concurrently, given pairs of messages and emojis. A reaction that failed to be
+    added is logged without affecting the others.
+    """
+    results = await asyncio.gather(
+        *(message.add_reaction(emoji) for message, emoji in reactions), return_exceptions=True
+    )
+    for (message, emoji), result in zip(reactions, results):
+        if isinstance(result, Exception):
+            logger.error(
+                "Unable to add reaction %s to message_id=%d",
+                emoji,
+                message.id,
+                exc_info=result,
+            )
+
 
 async def grant(voting_message_id):
+    # The proposal and the original channel are retrieved once and reused in the error handler,
+    # because by then the proposal may have already been removed from the active proposals
+    proposal = None
+    original_channel = None
     try:
         try:
             proposal = get_proposal(voting_message_id)
@@ -23,39 +52,48 @@ async def grant(voting_message_id):
             logger.error("Proposal not found. voting_message_id=%d", voting_message_id)
             return
 
+        # The channels are retrieved once and reused below (get_message is not used for this reason)
+        original_channel = client.get_channel(proposal.channel_id)
+        voting_channel = client.get_channel(VOTING_CHANNEL_ID)
+
         result = ProposalResult.ACCEPTED
+        # The proposal fields are bound to local variables once, because they're used multiple times
+        # below (and the history item conversion replaces author and mention with nicknames)
+        mention, description, author, is_grantless = (
+            proposal.mention,
+            proposal.description,
+            proposal.author,
+            proposal.is_grantless,
+        )
+        # Grantless proposals have no amount
+        amount_to_print = None if is_grantless else get_amount_to_print(proposal.amount)
 
-        # Retrieve the original proposal message
-        # get_message is not used here for a reason - the channel variables are reused later
-        original_channel = client.get_channel(proposal.channel_id)
-        original_message = await original_channel.fetch_message(proposal.message_id)
+        # Retrieve the original proposal message and the voting message concurrently
+        original_message, voting_message = await asyncio.gather(
+            original_channel.fetch_message(proposal.message_id),
+            voting_channel.fetch_message(voting_message_id),
+        )
         link_to_original_message = original_message.jump_url if original_message else None
-        # Retrieve the voting message
-        voting_channel = client.get_channel(VOTING_CHANNEL_ID)
-        voting_message = await voting_channel.fetch_message(proposal.voting_message_id)
 
         # Applying the grant if the proposal isn't grantless
-        if not proposal.is_grantless:
+        if not is_grantless:
             # Construct the grant message
-            grant_message = GRANT_COMMAND_LAZY_CONSENSUS_MESSAGE.format(
-                prefix=DISCORD_COMMAND_PREFIX,
-                grant_command=GRANT_APPLY_COMMAND_NAME,
-                mention=proposal.mention,
-                amount=get_amount_to_print(proposal.amount),
-                description=proposal.description,
-                author=proposal.author,
+            grant_message = format_grant_message(
+                mention=mention,
+                amount=amount_to_print,
+                description=description,
+                author=author,
                 voting_url=voting_message.jump_url,
             )
 
-            # Apply the grant
+            # Apply the grant (this is done before anything else, because the rest depends on it)
             try:
                 channel = client.get_channel(GRANT_APPLY_CHANNEL_ID)
-                message = await channel.send(grant_message)
-                # Remove embeds
-                await message.edit(suppress=True)
+                # Embeds are suppressed when sending, instead of editing the message afterwards
+                await channel.send(grant_message, suppress_embeds=True)
             except Exception as e:
                 await voting_channel.send(
-                    f"Could not apply grant for {proposal.mention}. cc {RESPONSIBLE_MENTION}",
+                    f"Could not apply grant for {mention}. cc {RESPONSIBLE_MENTION}",
                 )
                 logger.critical(
                     "An error occurred while sending grant message, voting_message_id=%d",
@@ -65,25 +103,34 @@ async def grant(voting_message_id):
                 # Throwing exception further because if the grant failed to apply, we don't want to do anything else
                 raise e
 
-        # Add "accepted" reactions to all messages
+        # The requests below don't depend on each other, so they're collected to run concurrently
+        tasks = []
+
+        # Add "accepted" reactions to all messages (the proposal is accepted even if some of them fail)
+        reactions = []
         if original_message:
-            await original_message.add_reaction(REACTION_ON_PROPOSAL_ACCEPTED)
+            reactions.append((original_message, REACTION_ON_PROPOSAL_ACCEPTED))
         if voting_message:
-            await voting_message.add_reaction(REACTION_ON_PROPOSAL_ACCEPTED)
-            await voting_message.add_reaction(EMOJI_HOORAY)
+            reactions.append((voting_message, REACTION_ON_PROPOSAL_ACCEPTED))
+            reactions.append((voting_message, EMOJI_HOORAY))
+        tasks.append(add_reactions(reactions))
 
         # Reply to the original proposal message, if it still exists, and if it wasn't send in the voting channel (to avoid flooding)
         if original_message and (voting_channel.id != original_channel.id):
-            if not proposal.is_grantless:
-                await original_message.reply(
-                    GRANT_PROPOSAL_RESULT_PROPOSER_RESPONSE[result].format(
-                        mention=proposal.mention,
-                        amount=get_amount_to_print(proposal.amount),
+            if not is_grantless:
+                tasks.append(
+                    original_message.reply(
+                        GRANT_PROPOSAL_RESULT_PROPOSER_RESPONSE[result].format(
+                            mention=mention,
+                            amount=amount_to_print,
+                        )
                     )
                 )
             else:
-                await original_message.reply(
-                    GRANTLESS_PROPOSAL_RESULT_PROPOSER_RESPONSE[result].format()
+                tasks.append(
+                    original_message.reply(
+                        GRANTLESS_PROPOSAL_RESULT_PROPOSER_RESPONSE[result].format()
+                    )
                 )
         elif not original_message:
             logger.warning(
@@ -93,57 +140,66 @@ async def grant(voting_message_id):
 
         # Update the proposal results in the voting channel
         if voting_message:
-            if proposal.is_grantless:
-                await voting_message.edit(
-                    content=GRANTLESS_PROPOSAL_ACCEPTED_VOTING_CHANNEL_EDIT.format(
-                        author=proposal.author,
-                        description=proposal.description,
-                        # TODO#9 if original_message is None, message should be different
-                        link_to_original_message=link_to_original_message,
-                    ),
-                    suppress=True,
+            if is_grantless:
+                tasks.append(
+                    voting_message.edit(
+                        content=GRANTLESS_PROPOSAL_ACCEPTED_VOTING_CHANNEL_EDIT.format(
+                            author=author,
+                            description=description,
+                            # TODO#9 if original_message is None, message should be different
+                            link_to_original_message=link_to_original_message,
+                        ),
+                        suppress=True,
+                    )
                 )
             else:
-                await voting_message.edit(
-                    content=GRANT_PROPOSAL_ACCEPTED_VOTING_CHANNEL_EDIT.format(
-                        amount=get_amount_to_print(proposal.amount),
-                        mention=proposal.mention,
-                        description=proposal.description,
-                        author=proposal.author,
-                        # TODO#9 if original_message is None, message should be different
-                        link_to_original_message=link_to_original_message,
-                    ),
-                    suppress=True,
+                tasks.append(
+                    voting_message.edit(
+                        content=GRANT_PROPOSAL_ACCEPTED_VOTING_CHANNEL_EDIT.format(
+                            amount=amount_to_print,
+                            mention=mention,
+                            description=description,
+                            author=author,
+                            # TODO#9 if original_message is None, message should be different
+                            link_to_original_message=link_to_original_message,
+                        ),
+                        suppress=True,
+                    )
                 )
         else:
             # Handling the case when voting message was somehow removed from the channel
-            if not proposal.is_grantless:
-                message = await voting_channel.send(
-                    ERROR_MESSAGE_PROPOSAL_WITH_GRANT_VOTING_LINK_REMOVED.format(
-                        amount=get_amount_to_print(proposal.amount),
-                        mention=proposal.mention,
-                        link_to_original_message=f"Original message: {link_to_original_message}",
-                        RESPONSIBLE_MENTION=RESPONSIBLE_MENTION,
+            if not is_grantless:
+                tasks.append(
+                    voting_channel.send(
+                        ERROR_MESSAGE_PROPOSAL_WITH_GRANT_VOTING_LINK_REMOVED.format(
+                            amount=amount_to_print,
+                            mention=mention,
+                            link_to_original_message=f"Original message: {link_to_original_message}",
+                            RESPONSIBLE_MENTION=RESPONSIBLE_MENTION,
+                        ),
+                        suppress_embeds=True,
                     )
                 )
-                # Remove embeds
-                await message.edit(suppress=True)
             else:
-                message = await voting_channel.send(
-                    ERROR_MESSAGE_GRANTLESS_PROPOSAL_VOTING_LINK_REMOVED.format(
-                        author=proposal.author,
-                        link_to_original_message=f"Original message: {link_to_original_message}",
-                        RESPONSIBLE_MENTION=RESPONSIBLE_MENTION,
+                tasks.append(
+                    voting_channel.send(
+                        ERROR_MESSAGE_GRANTLESS_PROPOSAL_VOTING_LINK_REMOVED.format(
+                            author=author,
+                            link_to_original_message=f"Original message: {link_to_original_message}",
+                            RESPONSIBLE_MENTION=RESPONSIBLE_MENTION,
+                        ),
+                        suppress_embeds=True,
                     )
                 )
-                # Remove embeds
-                await message.edit(suppress=True)
             logger.warning(
                 "Warning: The proposal message in the voting channel not found. voting_message_id=%d",
                 voting_message_id,
             )
 
-        # Add history item for analytics
+        await asyncio.gather(*tasks)
+
+        # Add history item for analytics, only once the requests above have succeeded (otherwise
+        # the proposal stays active and would be added to the history again when approved later)
         await db.add_proposals_history_item(proposal, result)
         logger.debug(
             "Added history item, voting_message_id=%d, result=%s",
@@ -161,10 +217,9 @@ async def grant(voting_message_id):
 
     except Exception as e:
         try:
-            # Try replying in Discord
-            proposal = get_proposal(voting_message_id)
-            channel = client.get_channel(proposal.channel_id)
-            original_message = await channel.fetch_message(voting_message_id)
+            # Try replying in Discord (if the error occurred before the channel was retrieved, this
+            # will fail and be logged below)
+            original_message = await original_channel.fetch_message(proposal.message_id)
 
             await original_message.reply(
                 f"An unexpected error occurred when approving the proposal. cc {RESPONSIBLE_MENTION}"
@@ -1,14 +1,15 @@
-import logging
+import asyncio
 import csv
 import io
 import discord
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from sqlalchemy import select
 
 from bot.config.const import *
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 from bot.utils.discord_utils import get_discord_client, get_message, get_user_by_id_or_mention
 from bot.utils.validation import validate_roles
 from bot.utils.db_utils import DBUtil
@@ -16,10 +17,7 @@ from bot.utils.formatting_utils import get_amount_to_print
 from bot.config.schemas import ProposalHistory, FreeFundingTransaction, FreeFundingBalance
 from bot.config.const import ProposalResult, VOTING_CHANNEL_ID
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 db = DBUtil()
 client = get_discord_client()
@@ -114,141 +112,207 @@ async def help(ctx):
         )
 
 
-def define_columns(page, columns):
+# Column names and widths of the exported pages
+LAZY_CONSENSUS_HISTORY_COLUMNS = [
+    {"header": "Discord link", "width": 15},
+    {"header": "When completed (UTC time)", "width": 28},
+    {"header": "Author", "width": 15},
+    {"header": "Grant given to", "width": 15},
+    {"header": "Amount", "width": 10},
+    {"header": "Description", "width": 100},
+]
+FREE_FUNDING_BALANCE_COLUMNS = [
+    {"header": "Author", "width": 15},
+    {"header": "Remaining balance", "width": 20},
+]
+FREE_FUNDING_TRANSACTIONS_COLUMNS = [
+    {"header": "Discord link", "width": 15},
+    {"header": "UTC time", "width": 20},
+    {"header": "Author", "width": 15},
+    {"header": "Sent to", "width": 20},
+    {"header": "Total amount", "width": 15},
+    {"header": "Description", "width": 100},
+]
+# The columns are fixed, so their letters are computed once for all pages
+COLUMN_LETTERS = [
+    get_column_letter(col_num)
+    for col_num in range(
+        1,
+        max(
+            len(LAZY_CONSENSUS_HISTORY_COLUMNS),
+            len(FREE_FUNDING_BALANCE_COLUMNS),
+            len(FREE_FUNDING_TRANSACTIONS_COLUMNS),
+        )
+        + 1,
+    )
+]
+
+
+def define_columns(page, columns, note=None):
     """
-    Columns are defined the same way for each page, with bold headers.
+    Columns are defined the same way for each page, with bold headers. An optional note is written
+    in italic next to the headers.
     """
-    # Write the column names to the worksheet and set column widths
-    for col_num, column in enumerate(columns, 1):
-        column_letter = get_column_letter(col_num)
-        column_header = column["header"]
-        column_width = column["width"]
-        page.column_dimensions[column_letter].width = column_width
-        page.cell(row=1, column=col_num, value=column_header).font = Font(bold=True)
-
-
-async def write_lazy_consensus_history(page):
-    # Define column names and widths
-    columns = [
-        {"header": "Discord link", "width": 15},
-        {"header": "When completed (UTC time)", "width": 28},
-        {"header": "Author", "width": 15},
-        {"header": "Grant given to", "width": 15},
-        {"header": "Amount", "width": 10},
-        {"header": "Description", "width": 100},
-    ]
-    # Enable the columns in the page
-    define_columns(page, columns)
+    # Set column widths (in write-only mode, this must be done before writing any rows), and
+    # prepare the header row in the same pass
+    header_font = Font(bold=True)
+    header_row = []
+    for column_letter, column in zip(COLUMN_LETTERS, columns):
+        page.column_dimensions[column_letter].width = column["width"]
+        header_cell = WriteOnlyCell(page, value=column["header"])
+        header_cell.font = header_font
+        header_row.append(header_cell)
+    if note:
+        note_cell = WriteOnlyCell(page, value=note)
+        note_cell.font = Font(italic=True)
+        header_row.append(note_cell)
+    # Write the column names to the worksheet
+    page.append(header_row)
+
+
+def hyperlink_cell(page, url):
+    """
+    Returns a cell that displays the URL and links to it.
+    """
+    cell = WriteOnlyCell(page, value=url)
+    cell.hyperlink = url
+    return cell
 
-    # Retrieve all accepted proposals
-    accepted_proposals = await db.filter(
-        ProposalHistory,
-        condition=(ProposalHistory.result == ProposalResult.ACCEPTED.value),
-    )
-    # Loop over each accepted proposal and add a row to the worksheet
-    for row_num, proposal in enumerate(accepted_proposals.all(), 2):
-        # Discord URL
-        discord_link = proposal.voting_message_url
-        page.cell(row=row_num, column=1).value = discord_link
-        page.cell(row=row_num, column=1).hyperlink = discord_link
-        # Date
-        page.cell(row=row_num, column=2, value=proposal.closed_at.strftime("%Y-%m-%d %H:%M:%S"))
-        # Author
-        page.cell(row=row_num, column=3, value=str(proposal.author))
-        # Mention
-        page.cell(
-            row=row_num,
-            column=4,
-            value=str(proposal.mention) if proposal.mention is not None else EMPTY_ANALYTICS_VALUE,
+
+async def get_lazy_consensus_history():
+    """
+    Returns the exported columns of all accepted proposals.
+    """
+    # Only the exported columns are selected, instead of loading full ORM objects of the history
+    accepted_proposals = await db.execute(
+        select(
+            ProposalHistory.voting_message_url,
+            ProposalHistory.closed_at,
+            ProposalHistory.author,
+            ProposalHistory.mention,
+            ProposalHistory.amount,
+            ProposalHistory.description,
         )
-        # Amount
-        page.cell(
-            row=row_num,
-            column=5,
-            value=str(get_amount_to_print(proposal.amount))
-            if proposal.amount is not None
-            else EMPTY_ANALYTICS_VALUE,
+        .where(ProposalHistory.result == ProposalResult.ACCEPTED.value)
+    )
+    return accepted_proposals.all()
+
+
+async def get_free_funding_balances():
+    """
+    Returns the exported columns of all free funding balances.
+    """
+    all_balances = await db.execute(
+        select(FreeFundingBalance.nickname, FreeFundingBalance.balance), is_history=False
+    )
+    return all_balances.all()
+
+
+async def get_free_funding_transactions():
+    """
+    Returns the exported columns of all free funding transactions.
+    """
+    all_transactions = await db.execute(
+        select(
+            FreeFundingTransaction.message_url,
+            FreeFundingTransaction.submitted_at,
+            FreeFundingTransaction.author,
+            FreeFundingTransaction.mentions,
+            FreeFundingTransaction.total_amount,
+            FreeFundingTransaction.description,
         )
-        # Description
-        page.cell(row=row_num, column=6, value=str(proposal.description))
+    )
+    return all_transactions.all()
 
 
-async def write_free_funding_balance(page):
-    # Define column names and widths
-    columns = [
-        {"header": "Author", "width": 15},
-        {"header": "Remaining balance", "width": 20},
-    ]
+def write_lazy_consensus_history(page, accepted_proposals):
     # Enable the columns in the page
-    define_columns(page, columns)
-    # Write a note in the corner
-    page.cell(
-        row=1, column=3, value="Note: only users that have used tips in this season are listed here"
-    ).font = Font(italic=True)
+    define_columns(page, LAZY_CONSENSUS_HISTORY_COLUMNS)
+
+    # Loop over each accepted proposal and add a row to the worksheet
+    for voting_message_url, closed_at, author, mention, amount, description in accepted_proposals:
+        page.append(
+            [
+                # Discord URL
+                hyperlink_cell(page, voting_message_url),
+                # Date
+                closed_at.isoformat(sep=" ", timespec="seconds"),
+                # Author
+                str(author),
+                # Mention
+                str(mention) if mention is not None else EMPTY_ANALYTICS_VALUE,
+                # Amount
+                str(get_amount_to_print(amount)) if amount is not None else EMPTY_ANALYTICS_VALUE,
+                # Description
+                str(description),
+            ]
+        )
 
-    # Retrieve all balances
-    all_balances = await db.filter(FreeFundingBalance, is_history=False)
+
+def write_free_funding_balance(page, all_balances):
+    # Enable the columns in the page, with a note in the corner
+    define_columns(
+        page,
+        FREE_FUNDING_BALANCE_COLUMNS,
+        note="Note: only users that have used tips in this season are listed here",
+    )
 
     # Loop over each users balance and add a row to the worksheet
-    for row_num, balance in enumerate(all_balances.all(), 2):
-        # Author
-        page.cell(row=row_num, column=1, value=str(balance.nickname))
-        # Amount
-        page.cell(row=row_num, column=2, value=str(get_amount_to_print(balance.balance)))
-
-
-async def write_free_funding_transactions(page):
-    # Define column names and widths
-    columns = [
-        {"header": "Discord link", "width": 15},
-        {"header": "UTC time", "width": 20},
-        {"header": "Author", "width": 15},
-        {"header": "Sent to", "width": 20},
-        {"header": "Total amount", "width": 15},
-        {"header": "Description", "width": 100},
-    ]
-    # Enable the columns in the page
-    define_columns(page, columns)
+    for nickname, balance in all_balances:
+        page.append(
+            [
+                # Author
+                str(nickname),
+                # Amount
+                str(get_amount_to_print(balance)),
+            ]
+        )
+
 
-    # Retrieve all transactions
-    all_transactions = await db.filter(FreeFundingTransaction)
+def write_free_funding_transactions(page, all_transactions):
+    # Enable the columns in the page
+    define_columns(page, FREE_FUNDING_TRANSACTIONS_COLUMNS)
 
     # Loop over each transaction and add a row to the worksheet
-    for row_num, transaction in enumerate(all_transactions.all(), 2):
-        # Discord URL
-        discord_link = transaction.message_url
-        page.cell(row=row_num, column=1).value = discord_link
-        page.cell(row=row_num, column=1).hyperlink = discord_link
-        # Date
-        page.cell(
-            row=row_num, column=2, value=transaction.submitted_at.strftime("%Y-%m-%d %H:%M:%S")
+    for message_url, submitted_at, author, mentions, total_amount, description in all_transactions:
+        page.append(
+            [
+                # Discord URL
+                hyperlink_cell(page, message_url),
+                # Date
+                submitted_at.isoformat(sep=" ", timespec="seconds"),
+                # Author
+                str(author),
+                # Mentions
+                str(mentions),
+                # Total amount
+                str(get_amount_to_print(total_amount)),
+                # Description
+                str(description),
+            ]
         )
-        # Author
-        page.cell(row=row_num, column=3, value=str(transaction.author))
-        # Mentions
-        page.cell(row=row_num, column=4, value=str(transaction.mentions))
-        # Total amount
-        page.cell(row=row_num, column=5, value=str(get_amount_to_print(transaction.total_amount)))
-        # Description
-        page.cell(row=row_num, column=6, value=str(transaction.description))
 
 
-async def export_xlsx():
-    # Create a new Excel workbook and worksheet
-    wb = openpyxl.Workbook()
+def build_xlsx(accepted_proposals, all_balances, all_transactions):
+    """
+    Builds the Excel document from the given data. Doesn't access DB or Discord, so that it can run
+    in a separate thread.
+    """
+    # Create a new Excel workbook in write-only mode, so that rows are streamed into the file
+    # instead of keeping a grid of cell objects in memory
+    wb = openpyxl.Workbook(write_only=True)
 
     # Create a page with a history of all lazy consensus proposals
-    lazy_history_page = wb.active
-    lazy_history_page.title = "Lazy Consensus History"
-    await write_lazy_consensus_history(lazy_history_page)
+    lazy_history_page = wb.create_sheet(title="Lazy Consensus History")
+    write_lazy_consensus_history(lazy_history_page, accepted_proposals)
 
     # Create a page with free funding balances of all members
     free_funding_balance_page = wb.create_sheet(title="Tips Balances")
-    await write_free_funding_balance(free_funding_balance_page)
+    write_free_funding_balance(free_funding_balance_page, all_balances)
 
     # Create a page with all free funding transactions
     free_funding_history_page = wb.create_sheet(title="Tips Transactions")
-    await write_free_funding_transactions(free_funding_history_page)
+    write_free_funding_transactions(free_funding_history_page, all_transactions)
 
     # Save the Excel workbook to a temporary file
     temp_file = io.BytesIO()
@@ -258,6 +322,17 @@ async def export_xlsx():
     return temp_file, EXPORT_DATA_FILENAME
 
 
+async def export_xlsx():
+    # Retrieve the data in the event loop, because the DB sessions are shared with other coroutines
+    accepted_proposals = await get_lazy_consensus_history()
+    all_balances = await get_free_funding_balances()
+    all_transactions = await get_free_funding_transactions()
+
+    # Building the document is CPU-bound (openpyxl serializes XML in pure Python), so it runs in a
+    # separate thread in order not to block the bot while it's working
+    return await asyncio.to_thread(build_xlsx, accepted_proposals, all_balances, all_transactions)
+
+
 @client.command(name=EXPORT_COMMAND_NAME)
 async def export(ctx):
     try:
@@ -1,5 +1,4 @@
 import asyncio
-import logging
 import typing
 import discord
 import re
@@ -15,7 +14,7 @@ from bot.utils.proposal_utils import (
     add_proposal,
     is_relevant_proposal,
 )
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 from bot.utils.validation import validate_roles, validate_grant_message, validate_grantless_message
 from bot.utils.discord_utils import get_discord_client
 from bot.utils.formatting_utils import (
@@ -25,10 +24,7 @@ from bot.utils.formatting_utils import (
 )
 from bot.config.schemas import Proposals
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 db = DBUtil()
 client = get_discord_client()
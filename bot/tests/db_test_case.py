@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bot.config.schemas import Base
+from bot.utils.db_utils import DBUtil
+
+
+class DBTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    A test case that runs DBUtil against an in-memory DB. DBUtil keeps the engines, the sessions and
+    the locks in class attributes, so all of them are saved before each test and restored after it
+    (including the attributes added to DBUtil later on).
+    """
+
+    def setUp(self):
+        self.original_attributes = {
+            name: value
+            for name, value in vars(DBUtil).items()
+            if not name.startswith("__") and not callable(value)
+        }
+
+        # The runtime and the history DBs share the same in-memory engine
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        DBUtil.engine = DBUtil.engine_history = self.engine
+        DBUtil.session = sessionmaker(bind=self.engine, expire_on_commit=False)()
+        DBUtil.session_history = sessionmaker(bind=self.engine, expire_on_commit=False)()
+        # Each test runs in its own event loop, so the locks are created anew
+        for name, value in self.original_attributes.items():
+            if isinstance(value, asyncio.Lock):
+                setattr(DBUtil, name, asyncio.Lock())
+        DBUtil.delayed_commit = None
+
+    def tearDown(self):
+        DBUtil.session.close()
+        DBUtil.session_history.close()
+        Base.metadata.drop_all(self.engine)
+        for name, value in self.original_attributes.items():
+            setattr(DBUtil, name, value)
@@ -0,0 +1,97 @@
+import asyncio
+import datetime
+import unittest
+import unittest.mock as mock
+
+from sqlalchemy.orm import sessionmaker
+
+from bot.config.schemas import Proposals, Voters
+from bot.utils.db_utils import DBUtil
+from bot.tests.db_test_case import DBTestCase
+
+
+class TestAppendWithDelayedCommit(DBTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = DBUtil()
+
+        self.proposal = Proposals(
+            message_id=1,
+            channel_id=1,
+            voting_message_id=2,
+            mention="test_user",
+            amount=100,
+            description="test_description",
+            submitted_at=datetime.datetime.utcnow(),
+            closed_at=datetime.datetime.utcnow(),
+        )
+        DBUtil.session.add(self.proposal)
+        DBUtil.session.commit()
+
+    def get_saved_voters_count(self):
+        # A separate session is used to see what was actually committed
+        session = sessionmaker(bind=self.engine)()
+        count = session.query(Voters).count()
+        session.close()
+        return count
+
+    async def append_voter(self, user_id):
+        await self.db.append_with_delayed_commit(
+            self.proposal.voters, Voters(user_id=user_id, voting_message_id=2)
+        )
+
+    async def test_concurrent_appends_are_committed_once(self):
+        with mock.patch.object(DBUtil.session, "commit", wraps=DBUtil.session.commit) as commit:
+            await asyncio.gather(*(self.append_voter(i) for i in range(3)))
+            # The appends don't wait for the commit, so the voters are only in memory so far
+            self.assertEqual(len(self.proposal.voters), 3)
+            self.assertEqual(self.get_saved_voters_count(), 0)
+
+            await DBUtil.delayed_commit
+
+        self.assertEqual(commit.call_count, 1)
+        self.assertEqual(self.get_saved_voters_count(), 3)
+        self.assertIsNone(DBUtil.delayed_commit)
+
+    async def test_appends_after_commit_schedule_next_commit(self):
+        await self.append_voter(1)
+        first_commit = DBUtil.delayed_commit
+        await first_commit
+
+        await self.append_voter(2)
+        self.assertIsNot(DBUtil.delayed_commit, first_commit)
+        await DBUtil.delayed_commit
+
+        self.assertEqual(self.get_saved_voters_count(), 2)
+
+    async def test_cancelled_commit_does_not_block_next_commits(self):
+        await self.append_voter(1)
+        # Cancel the commit before it starts
+        cancelled_commit = DBUtil.delayed_commit
+        cancelled_commit.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled_commit
+
+        # The change of the cancelled commit is saved by the next one
+        await self.append_voter(2)
+        await asyncio.wait_for(DBUtil.delayed_commit, timeout=1)
+
+        self.assertEqual(self.get_saved_voters_count(), 2)
+
+    async def test_commit_cancelled_while_waiting_is_unscheduled(self):
+        await self.append_voter(1)
+        cancelled_commit = DBUtil.delayed_commit
+        # Let the commit start waiting, then cancel it
+        await asyncio.sleep(0)
+        cancelled_commit.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled_commit
+        self.assertIsNone(DBUtil.delayed_commit)
+
+        await self.append_voter(2)
+        await asyncio.wait_for(DBUtil.delayed_commit, timeout=1)
+
+        self.assertEqual(self.get_saved_voters_count(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import datetime
+import unittest
+
+import openpyxl
+
+from bot.config.const import *
+from bot.config.schemas import ProposalHistory, FreeFundingBalance, FreeFundingTransaction
+from bot.utils.db_utils import DBUtil
+from bot.tests.db_test_case import DBTestCase
+from bot.help import export_xlsx
+
+CLOSED_AT = datetime.datetime(2023, 3, 1, 12, 30, 45, 123456)
+
+
+class TestExportXlsx(DBTestCase):
+    def setUp(self):
+        super().setUp()
+        session = DBUtil.session_history
+        # An accepted proposal with a grant, an accepted grantless proposal and a cancelled one
+        session.add_all(
+            [
+                ProposalHistory(
+                    author="author1",
+                    voting_message_id=1,
+                    is_grantless=False,
+                    mention="receiver1",
+                    amount=100.5,
+                    description="description1",
+                    closed_at=CLOSED_AT,
+                    result=ProposalResult.ACCEPTED.value,
+                    voting_message_url="https://discord.com/channels/1/2/1",
+                ),
+                ProposalHistory(
+                    author="author2",
+                    voting_message_id=2,
+                    is_grantless=True,
+                    description="description2",
+                    closed_at=CLOSED_AT,
+                    result=ProposalResult.ACCEPTED.value,
+                    voting_message_url="https://discord.com/channels/1/2/2",
+                ),
+                ProposalHistory(
+                    author="author3",
+                    voting_message_id=3,
+                    is_grantless=True,
+                    description="description3",
+                    closed_at=CLOSED_AT,
+                    result=ProposalResult.CANCELLED_BY_REACHING_THRESHOLD.value,
+                    voting_message_url="https://discord.com/channels/1/2/3",
+                ),
+                FreeFundingBalance(author="<@1>", nickname="nickname1", balance=2500.0),
+                FreeFundingTransaction(
+                    author="nickname1",
+                    mentions="nickname2, nickname3",
+                    total_amount=300,
+                    description="description4",
+                    submitted_at=CLOSED_AT,
+                    message_url="https://discord.com/channels/1/3/4",
+                ),
+            ]
+        )
+        session.commit()
+
+    async def export_workbook(self):
+        document, filename = await export_xlsx()
+        self.assertEqual(filename, EXPORT_DATA_FILENAME)
+        return openpyxl.load_workbook(document)
+
+    def get_values(self, page):
+        return [[cell.value for cell in row] for row in page.iter_rows()]
+
+    async def test_lazy_consensus_history(self):
+        page = (await self.export_workbook())["Lazy Consensus History"]
+
+        # Only the accepted proposals are exported, with placeholders for the missing grant values
+        self.assertEqual(
+            self.get_values(page),
+            [
+                [
+                    "Discord link",
+                    "When completed (UTC time)",
+                    "Author",
+                    "Grant given to",
+                    "Amount",
+                    "Description",
+                ],
+                [
+                    "https://discord.com/channels/1/2/1",
+                    "2023-03-01 12:30:45",
+                    "author1",
+                    "receiver1",
+                    "100.5",
+                    "description1",
+                ],
+                [
+                    "https://discord.com/channels/1/2/2",
+                    "2023-03-01 12:30:45",
+                    "author2",
+                    EMPTY_ANALYTICS_VALUE,
+                    EMPTY_ANALYTICS_VALUE,
+                    "description2",
+                ],
+            ],
+        )
+        self.assertTrue(all(cell.font.b for cell in page[1]))
+        self.assertFalse(page["A2"].font.b)
+        self.assertEqual(page["A2"].hyperlink.target, "https://discord.com/channels/1/2/1")
+        self.assertEqual(page.column_dimensions["F"].width, 100)
+
+    async def test_free_funding_balances(self):
+        page = (await self.export_workbook())["Tips Balances"]
+
+        self.assertEqual(
+            self.get_values(page),
+            [
+                [
+                    "Author",
+                    "Remaining balance",
+                    "Note: only users that have used tips in this season are listed here",
+                ],
+                ["nickname1", "2500", None],
+            ],
+        )
+        self.assertTrue(page["A1"].font.b)
+        # The note is written in italic next to the headers
+        self.assertTrue(page["C1"].font.i)
+        self.assertFalse(page["C1"].font.b)
+
+    async def test_free_funding_transactions(self):
+        page = (await self.export_workbook())["Tips Transactions"]
+
+        self.assertEqual(
+            self.get_values(page),
+            [
+                ["Discord link", "UTC time", "Author", "Sent to", "Total amount", "Description"],
+                [
+                    "https://discord.com/channels/1/3/4",
+                    "2023-03-01 12:30:45",
+                    "nickname1",
+                    "nickname2, nickname3",
+                    "300",
+                    "description4",
+                ],
+            ],
+        )
+        self.assertTrue(all(cell.font.b for cell in page[1]))
+        self.assertEqual(page["A2"].hyperlink.target, "https://discord.com/channels/1/3/4")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -69,6 +69,29 @@ class TestGrantProposals(unittest.TestCase):
         assert self.session.query(Proposals).filter_by(id=proposal_id).count() == 0
         assert self.session.query(Voters).filter(Voters.id.in_(vote_ids)).count() == 0
 
+    def test_voters_are_loaded_with_proposals(self):
+        # Create grant proposals with associated votes
+        for message_id in range(3):
+            grant_proposal = Proposals(
+                message_id=message_id,
+                channel_id=1,
+                mention="test_user",
+                amount=100,
+                description="test_description",
+            )
+            self.session.add(grant_proposal)
+            self.session.add_all([Voters(user_id=i, grant_proposal=grant_proposal) for i in range(2)])
+        self.session.commit()
+        self.session.expunge_all()
+
+        # Load the proposals and detach them, so that any lazy load of voters would raise an error
+        proposals = self.session.query(Proposals).all()
+        self.session.close()
+
+        # Check that the voters were loaded together with the proposals
+        for proposal in proposals:
+            self.assertEqual(len(proposal.voters), 2)
+
 
 class TestVoters(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,106 @@
+import asyncio
+import datetime
+import types
+import unittest
+import unittest.mock as mock
+
+from bot.config.const import *
+from bot.config.schemas import Proposals
+from bot.utils.db_utils import DBUtil
+from bot.utils import proposal_utils
+from bot.tests.db_test_case import DBTestCase
+import bot.vote as vote
+
+
+class TestHandleReactionAdd(DBTestCase):
+    def setUp(self):
+        super().setUp()
+        self.proposal = Proposals(
+            message_id=1,
+            channel_id=2,
+            author="<@1>",
+            voting_message_id=3,
+            is_grantless=True,
+            description="test_description",
+            submitted_at=datetime.datetime.utcnow(),
+            closed_at=datetime.datetime.utcnow(),
+            bot_response_message_id=4,
+            threshold=2,
+        )
+        DBUtil.session.add(self.proposal)
+        DBUtil.session.commit()
+        proposal_utils.add_proposal(self.proposal)
+
+    def tearDown(self):
+        proposal_utils.proposals.clear()
+        proposal_utils.proposals_by_initiator_message.clear()
+        super().tearDown()
+
+    def get_payload(self, user_id):
+        return types.SimpleNamespace(
+            emoji=types.SimpleNamespace(name=CANCEL_EMOJI_UNICODE),
+            event_type="REACTION_ADD",
+            guild_id=5,
+            channel_id=VOTING_CHANNEL_ID,
+            message_id=self.proposal.voting_message_id,
+            user_id=user_id,
+            member=types.SimpleNamespace(mention=f"<@{user_id}>"),
+        )
+
+    def mock_messages(self, get_message):
+        message = get_message.return_value
+        message.edit = mock.AsyncMock()
+        message.add_reaction = mock.AsyncMock()
+        message.reply = mock.AsyncMock()
+        return message
+
+    @mock.patch.object(vote, "validate_roles", mock.AsyncMock(return_value=True))
+    @mock.patch.object(vote.client, "get_guild", mock.MagicMock())
+    @mock.patch.object(vote, "get_voting_channel", mock.MagicMock())
+    @mock.patch.object(vote, "send_dm")
+    @mock.patch.object(vote, "reply_to_message")
+    @mock.patch.object(DBUtil, "add_proposals_history_item")
+    @mock.patch.object(vote, "get_message")
+    async def test_concurrent_votes_reaching_threshold_cancel_once(
+        self, get_message, add_proposals_history_item, reply_to_message, send_dm
+    ):
+        message = self.mock_messages(get_message)
+
+        # The votes don't wait for each other to be committed, so only the second one reaches the
+        # threshold
+        await asyncio.gather(
+            vote.handle_reaction_add(self.get_payload(10)),
+            vote.handle_reaction_add(self.get_payload(11)),
+        )
+        await asyncio.gather(*vote.background_tasks)
+
+        message.edit.assert_called_once()
+        add_proposals_history_item.assert_called_once_with(
+            self.proposal, ProposalResult.CANCELLED_BY_REACHING_THRESHOLD
+        )
+        send_dm.assert_called_once()
+        reply_to_message.assert_not_called()
+        self.assertFalse(proposal_utils.is_relevant_proposal(self.proposal.voting_message_id))
+
+    @mock.patch.object(DBUtil, "add_proposals_history_item")
+    @mock.patch.object(vote, "get_message")
+    async def test_concurrent_cancellations_cancel_once(
+        self, get_message, add_proposals_history_item
+    ):
+        message = self.mock_messages(get_message)
+
+        # E.g. the proposer voted against while another vote reached the threshold
+        await asyncio.gather(
+            vote.cancel_proposal(self.proposal, ProposalResult.CANCELLED_BY_PROPOSER),
+            vote.cancel_proposal(self.proposal, ProposalResult.CANCELLED_BY_REACHING_THRESHOLD),
+        )
+
+        message.edit.assert_called_once()
+        add_proposals_history_item.assert_called_once_with(
+            self.proposal, ProposalResult.CANCELLED_BY_PROPOSER
+        )
+        self.assertFalse(proposal_utils.is_relevant_proposal(self.proposal.voting_message_id))
+        self.assertEqual(vote.cancelling_proposals, set())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,19 +5,15 @@ import discord
 import os
 
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.orm import Query
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 
 from bot.config.schemas import Base, Proposals, ProposalHistory, FreeFundingBalance
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 from bot.config.const import *
 from bot.utils.discord_utils import get_discord_client, get_message
 from bot.utils.formatting_utils import get_nickname_by_id_or_mention
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 client = get_discord_client()
 
@@ -35,6 +31,10 @@ class DBUtil:
     # The lock used during recovery to stop accepting proposals and voting
     recovery_lock = asyncio.Lock()
 
+    # The task of the delayed commit that is going to save the changes made meanwhile (None when no
+    # such commit is scheduled)
+    delayed_commit = None
+
     def is_recovery(self):
         if DBUtil.recovery_lock.locked():
             return True
@@ -43,13 +43,17 @@ class DBUtil:
     def connect_db(self):
         if DBUtil.engine is None:
             DBUtil.engine = create_engine(f"sqlite:///{DB_PATH}")
+        # Objects are not expired on commit, because the bot is the only one writing to DB, so the
+        # loaded proposals stay valid and don't need to be reloaded after each commit
         if DBUtil.session is None:
-            DBUtil.session = sessionmaker(bind=DBUtil.engine)()
+            DBUtil.session = sessionmaker(bind=DBUtil.engine, expire_on_commit=False)()
         # History db
         if DBUtil.engine_history is None:
             DBUtil.engine_history = create_engine(f"sqlite:///{DB_HISTORY_PATH}")
         if DBUtil.session_history is None:
-            DBUtil.session_history = sessionmaker(bind=DBUtil.engine_history)()
+            DBUtil.session_history = sessionmaker(
+                bind=DBUtil.engine_history, expire_on_commit=False
+            )()
         # run close_db once the main thread exits
         atexit.register(self.close_db)
 
@@ -90,39 +94,50 @@ class DBUtil:
         else:
             logger.info("Table already exist: %s", FREE_FUNDING_TRANSACTIONS_TABLE_NAME)
 
-    def get_user_free_funding_balance(self, author_mention) -> Query:
-        return DBUtil.session.query(FreeFundingBalance).filter_by(author=author_mention).first()
+        # Creating indexes that were added after the tables had been created
+        self.create_missing_indexes(DBUtil.engine)
+        self.create_missing_indexes(DBUtil.engine_history)
+
+    def create_missing_indexes(self, engine):
+        """
+        Creates the indexes defined in the schemas that don't exist in the DB yet. This is needed
+        because create_all only creates indexes together with new tables.
+        """
+        for table in Base.metadata.sorted_tables:
+            if not engine.has_table(table.name):
+                continue
+            for index in table.indexes:
+                # checkfirst makes it a "CREATE INDEX IF NOT EXISTS"
+                index.create(bind=engine, checkfirst=True)
+
+    def get_user_free_funding_balance(self, author_mention):
+        return DBUtil.session.scalars(
+            select(FreeFundingBalance).where(FreeFundingBalance.author == author_mention)
+        ).first()
 
-    def load_pending_grant_proposals(self) -> Query:
-        return DBUtil.session.query(Proposals)
+    def load_pending_grant_proposals(self):
+        return DBUtil.session.scalars(select(Proposals)).all()
 
-    def log_pending_grant_proposals(self) -> Query:
+    def log_pending_grant_proposals(self):
         # Load pending proposals from database
         pending_grant_proposals = self.load_pending_grant_proposals()
         logger.info("Logging pending proposals in DB on request")
-        logger.info("Total: %d", pending_grant_proposals.count())
+        logger.info("Total: %d", len(pending_grant_proposals))
         for proposal in pending_grant_proposals:
             logger.info(proposal)
 
-    async def filter(self, table, is_history=True, condition=None):
+    async def execute(self, statement, is_history=True):
         """
-        Filters the given ORM objects and returns a query (results should be retrieved using
-        statements like .all() or .first()). The DB is chosen depending on is_history parameter.
+        Executes the given statement and returns the result. The result should be consumed before
+        awaiting anything else, because other coroutines may use the same session meanwhile. The DB is
+        chosen depending on is_history parameter.
         """
         if is_history:
             async with DBUtil.session_lock_history:
-                query = DBUtil.session_history.query(table)
-                if condition:
-                    return query.filter(condition)
-                else:
-                    return query
+                return DBUtil.session_history.execute(statement)
         else:
             async with DBUtil.session_lock:
-                query = DBUtil.session.query(table)
-                if condition:
-                    return query.filter(condition)
-                else:
-                    return query
+                return DBUtil.session.execute(statement)
 
     async def add(self, orm_object):
         """
@@ -148,6 +163,41 @@ class DBUtil:
             list.append(orm_object)
             DBUtil.session.commit()
 
+    async def append_with_delayed_commit(self, list, orm_object):
+        """
+        Appends object to a list, and schedules a commit after VOTES_COMMIT_DELAY_SECONDS that saves
+        it together with the objects appended by other coroutines meanwhile. The commit isn't
+        awaited, so the caller can use the updated list right away (an error of the commit is
+        logged).
+        """
+        async with DBUtil.session_lock:
+            list.append(orm_object)
+
+        # Schedule the commit unless it's already scheduled (the task is also checked to be done, in
+        # case it was cancelled before it started)
+        if DBUtil.delayed_commit is None or DBUtil.delayed_commit.done():
+            DBUtil.delayed_commit = asyncio.create_task(self.commit_with_delay())
+            DBUtil.delayed_commit.add_done_callback(self.on_delayed_commit_done)
+
+    async def commit_with_delay(self):
+        """
+        Commits after VOTES_COMMIT_DELAY_SECONDS. Should only be scheduled by
+        append_with_delayed_commit.
+        """
+        try:
+            await asyncio.sleep(VOTES_COMMIT_DELAY_SECONDS)
+        finally:
+            # The changes made after this point will be saved by the next commit (the commit is
+            # unscheduled even if the task was cancelled, otherwise no commit would be scheduled
+            # anymore)
+            DBUtil.delayed_commit = None
+        async with DBUtil.session_lock:
+            DBUtil.session.commit()
+
+    def on_delayed_commit_done(self, task):
+        if not task.cancelled() and task.exception():
+            logger.critical("Unable to commit the delayed changes", exc_info=task.exception())
+
     async def remove(self, list, orm_object):
         """
         Remove object from a list.
@@ -161,43 +211,65 @@ class DBUtil:
             DBUtil.session_history.add(transaction)
             DBUtil.session_history.commit()
 
-    async def add_proposals_history_item(self, proposal, result):
+    async def get_proposal_history_item(self, proposal, result):
         """
-        Adds a proposal to the ProposalHistory table after it has been processed.
+        Returns a ProposalHistory object that copies the given proposal.
 
         Parameters:
         proposal (Proposals): The original proposal that needs to be added to the history.
         result (ProposalResult): The result of the proposal. This should be one of the enumerated values in `ProposalResult`.
         """
-        async with DBUtil.session_lock_history:
-            # Before writing to DB, we should modify some values using Discord API for them to be quickly retrieved when exporting analytics
-            # Converting author id to nickname
-            proposal.author = await get_nickname_by_id_or_mention(proposal.author)
-
-            # If the proposal has a grant, the mentioned person id will be converted to a nickname
-            if not proposal.is_grantless:
-                proposal.mention = await get_nickname_by_id_or_mention(proposal.mention)
-            # Retrieving voting message to save URL
-            voting_message = await get_message(
-                client, VOTING_CHANNEL_ID, proposal.voting_message_id
-            )
+        # Before writing to DB, we should modify some values using Discord API for them to be quickly retrieved when exporting analytics
+        # Converting author id to nickname
+        proposal.author = await get_nickname_by_id_or_mention(proposal.author)
+
+        # If the proposal has a grant, the mentioned person id will be converted to a nickname
+        if not proposal.is_grantless:
+            proposal.mention = await get_nickname_by_id_or_mention(proposal.mention)
+        # Retrieving voting message to save URL
+        voting_message = await get_message(client, VOTING_CHANNEL_ID, proposal.voting_message_id)
+
+        # Copy all attributes from Proposals table excluding some of them
+        proposal_dict = {
+            key: value
+            for key, value in proposal.__dict__.items()
+            if key != "_sa_instance_state" and key != "id" and key != "voters"
+        }
+
+        return ProposalHistory(
+            **proposal_dict,
+            result=result.value,
+            voting_message_url=voting_message.jump_url,
+        )
 
-            # Copy all attributes from Proposals table excluding some of them
-            proposal_dict = {
-                key: value
-                for key, value in proposal.__dict__.items()
-                if key != "_sa_instance_state" and key != "id" and key != "voters"
-            }
-
-            DBUtil.session_history.add(
-                ProposalHistory(
-                    **proposal_dict,
-                    result=result.value,
-                    voting_message_url=voting_message.jump_url,
-                )
+    async def add_proposals_history_items(self, proposals_with_results):
+        """
+        Adds proposals to the ProposalHistory table after they have been processed, with a single commit.
+
+        Parameters:
+        proposals_with_results (list): Pairs of the original proposal (Proposals) and its result (ProposalResult).
+        """
+        # Discord API is queried before acquiring the lock, so that other history writes don't wait for it
+        history_items = await asyncio.gather(
+            *(
+                self.get_proposal_history_item(proposal, result)
+                for proposal, result in proposals_with_results
             )
+        )
+        async with DBUtil.session_lock_history:
+            DBUtil.session_history.add_all(history_items)
             DBUtil.session_history.commit()
 
+    async def add_proposals_history_item(self, proposal, result):
+        """
+        Adds a proposal to the ProposalHistory table after it has been processed.
+
+        Parameters:
+        proposal (Proposals): The original proposal that needs to be added to the history.
+        result (ProposalResult): The result of the proposal. This should be one of the enumerated values in `ProposalResult`.
+        """
+        await self.add_proposals_history_items([(proposal, result)])
+
     async def save(self):
         async with DBUtil.session_lock:
             DBUtil.session.commit()
@@ -1,14 +1,9 @@
 import asyncio
 import time
-import logging
 
-from bot.config.const import DEFAULT_LOG_LEVEL
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 
 def measure_time(func):
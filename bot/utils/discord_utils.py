@@ -29,6 +29,20 @@ async def get_message(client: discord.Client, channel_id: int, message_id: int):
     return await channel.fetch_message(message_id)
 
 
+async def reply_to_message(channel_id: int, message_id: int, text: str):
+    """
+    Replies to the message with the specified ID without fetching it. If the message doesn't exist
+    anymore, the text is sent to the channel without a reply.
+    """
+    channel = client.get_partial_messageable(channel_id)
+    await channel.send(
+        text,
+        reference=discord.MessageReference(
+            message_id=message_id, channel_id=channel_id, fail_if_not_exists=False
+        ),
+    )
+
+
 async def send_dm(guild_id, user_id, text):
     """
     DMs a user with a specified message text, and removes embeds from it (they take space and don't
@@ -36,12 +50,11 @@ async def send_dm(guild_id, user_id, text):
     """
     guild = client.get_guild(guild_id)
     member = guild.get_member(user_id)
-    # Open DM with user
+    # Open DM with user (discord.py keeps the DM channels it has opened, so this only makes a
+    # request the first time)
     dm_channel = await member.create_dm()
-    # Send message
-    message = await dm_channel.send(text)
-    # Remove embeds from the message
-    await message.edit(suppress=True)
+    # Send message, removing embeds from it
+    await dm_channel.send(text, suppress_embeds=True)
 
 
 def get_discord_client(
@@ -1,7 +1,7 @@
 import re
 import discord
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from bot.utils.discord_utils import get_user_by_id_or_mention
 
 
@@ -54,6 +54,15 @@ def get_discord_countdown_plus_delta(delta_seconds):
     return get_discord_timestamp_plus_delta(delta_seconds, timestamp_string=timestamp_countdown)
 
 
+def get_utc_timestamp(utc_datetime):
+    """
+    Returns the Unix timestamp of the given naive UTC date and time, e.g. to be rendered by Discord
+    in the format "<t:{timestamp}:R>". Unlike get_discord_countdown_plus_delta, it doesn't depend on
+    the current time.
+    """
+    return int(utc_datetime.replace(tzinfo=timezone.utc).timestamp())
+
+
 def get_amount_to_print(amount):
     """
     Returns int if the number doesn't have a fractional part, or float otherwise. This is so not to
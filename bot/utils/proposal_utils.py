@@ -1,5 +1,4 @@
 import discord
-import logging
 import sys
 from datetime import datetime
 
@@ -8,28 +7,24 @@ from multipledispatch import dispatch
 
 from bot.utils.db_utils import DBUtil
 
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 from bot.config.schemas import Proposals, Voters
-from bot.config.const import DEFAULT_LOG_LEVEL
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 db = DBUtil()
 
 proposals = {}
+# Active proposals by the ids of the messages that initiated them - the original proposer message
+# and the bot reply to it (to find proposals by reactions on these messages without iterating)
+proposals_by_initiator_message = {}
 
 
 async def get_voter(user_id, voting_message_id):
-    voters_found = []
-    # Iterate through proposals and check for voters with matching ids
-    for id in proposals:
-        p = proposals[id]
-        for v in p.voters:
-            if v.user_id == user_id and v.voting_message_id == voting_message_id:
-                voters_found.append(v)
+    # Only the voters of the proposal with the given voting message are checked (voters are kept in
+    # memory along with their proposals, so no DB query is needed)
+    proposal = proposals.get(voting_message_id)
+    voters_found = [v for v in proposal.voters if v.user_id == user_id] if proposal else []
     # If a single match is found, return it
     if len(voters_found) == 1:
         return voters_found[0]
@@ -40,13 +35,15 @@ async def get_voter(user_id, voting_message_id):
 
 
 async def add_voter(proposal, voter):
-    await db.add(voter)
-    await db.append(proposal.voters, voter)
+    # The voter is saved together with the proposal voters (the relationship cascades it), and the
+    # votes added at about the same time are committed at once
+    await db.append_with_delayed_commit(proposal.voters, voter)
 
 
 async def remove_voter(proposal, voter):
+    # The delete-orphan cascade deletes the voter from DB once it's removed from the proposal, within
+    # the same commit
     await db.remove(proposal.voters, voter)
-    await db.delete(voter)
 
 
 def is_relevant_proposal(voting_message_id):
@@ -75,12 +72,17 @@ def get_proposal_initiated_by(message_id):
     """
     Returns a proposal that was either initiated by a message with the given id, or the bot has replied with a message of given id to the initial proposer message (bot_response_message_id).Use case: to cover users who have reacted to a wrong message (this is helpful during onboarding).
     """
-    if not proposals:
-        return None
-    for proposal in proposals.values():
-        if proposal.message_id == message_id or proposal.bot_response_message_id == message_id:
-            return proposal
-    return None
+    return proposals_by_initiator_message.get(message_id)
+
+
+def get_initiator_message_ids(proposal):
+    """
+    Returns the ids of the messages that initiated the proposal. The bot response id is 0 when the
+    bot hasn't replied to the proposer.
+    """
+    if proposal.bot_response_message_id:
+        return (proposal.message_id, proposal.bot_response_message_id)
+    return (proposal.message_id,)
 
 
 async def remove_proposal(voting_message_id, db: DBUtil):
@@ -88,7 +90,9 @@ async def remove_proposal(voting_message_id, db: DBUtil):
         logger.info("Removing data: %s", proposals[voting_message_id])
         # Removing from DB; the delete-orphan cascade will clean up the Voters table with the associated data
         await db.delete(proposals[voting_message_id])
-        # Removing from dict
+        # Removing from dicts
+        for message_id in get_initiator_message_ids(proposals[voting_message_id]):
+            proposals_by_initiator_message.pop(message_id, None)
         del proposals[voting_message_id]
     else:
         logger.critical(
@@ -174,8 +178,10 @@ def add_proposal(new_proposal):
     else:
         validate_proposal_with_grant(new_proposal)
 
-    # Adding to dict
+    # Adding to dicts
     proposals[new_proposal.voting_message_id] = new_proposal
+    for message_id in get_initiator_message_ids(new_proposal):
+        proposals_by_initiator_message[message_id] = new_proposal
     logger.info("Added proposal with voting_message_id=%s", new_proposal.voting_message_id)
 
 
@@ -6,7 +6,7 @@ from nltk.corpus import words
 from nltk.stem import WordNetLemmatizer
 from nltk.tokenize import word_tokenize
 
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 from bot.config.const import *
 
 from bot.utils.dev_utils import measure_time
@@ -16,10 +16,7 @@ from bot.utils.formatting_utils import (
     remove_discord_mentions,
 )
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 # Preparing ntlk to validate language of the proposal
 nltk.data.path.append(NLTK_DATASETS_DIR)
@@ -73,15 +70,14 @@ async def validate_roles(user: User) -> bool:
     """
 
     try:
-        logger.debug(user.roles)
+        roles = user.roles
     except AttributeError:
         # When user DMs a bot with a command, there will not be "roles" available
-        logger.debug("User doesn't have a 'roles' attribute, rejecting")
-        logger.debug(user)
+        logger.debug("User doesn't have a 'roles' attribute, rejecting: %s", user)
         return False
 
     # Check if user has allowed role
-    role = find(lambda r: r.id in ROLE_IDS_ALLOWED, user.roles)
+    role = find(lambda r: r.id in ROLE_IDS_ALLOWED, roles)
     if role is None:
         return False
     return True
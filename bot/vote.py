@@ -1,8 +1,7 @@
 import discord
 import asyncio
-from datetime import datetime, timedelta
 
-from bot.config.logging_config import log_handler, console_handler
+from bot.config.logging_config import get_logger
 from bot.config.const import *
 from bot.config.schemas import Voters
 
@@ -17,77 +16,223 @@ from bot.utils.proposal_utils import (
 )
 from bot.utils.db_utils import DBUtil
 from bot.utils.validation import validate_roles
-from bot.utils.discord_utils import get_discord_client, get_message, send_dm
-from bot.utils.formatting_utils import get_amount_to_print, get_discord_countdown_plus_delta
+from bot.utils.discord_utils import (
+    get_discord_client,
+    get_message,
+    send_dm,
+    reply_to_message,
+)
+from bot.utils.formatting_utils import get_amount_to_print, get_utc_timestamp
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 db = DBUtil()
 client = get_discord_client()
 
+# The voting channel is resolved once the client is ready, instead of on each vote
+voting_channel = None
+
+# The reactions on proposals are queued by the event handlers and handled by a fixed number of
+# workers, so that a burst of votes doesn't spawn a task per reaction, each waiting for DB and
+# Discord API at the same time
+vote_queue = asyncio.Queue(maxsize=VOTE_QUEUE_MAX_SIZE)
+vote_workers = set()
+
+
+@client.event
+async def on_ready():
+    global voting_channel
+    voting_channel = client.get_channel(VOTING_CHANNEL_ID)
+    # on_ready is called again after reconnecting, when the workers are already running
+    if not vote_workers:
+        for _ in range(VOTE_WORKERS_COUNT):
+            vote_workers.add(asyncio.create_task(vote_worker()))
+
+
+def get_voting_channel():
+    """
+    Returns the voting channel, resolving it if a reaction arrives before the client is ready.
+    """
+    global voting_channel
+    if voting_channel is None:
+        voting_channel = client.get_channel(VOTING_CHANNEL_ID)
+    return voting_channel
+
+
+# The reasons of cancelling as they're written to the log
+CANCELLED_PROPOSAL_LOG_MESSAGES = {
+    ProposalResult.CANCELLED_BY_PROPOSER: "(by the proposer)",
+    ProposalResult.CANCELLED_BY_REACHING_THRESHOLD: "(by reaching threshold)",
+}
+
+# The voting message ids of the proposals that are being cancelled
+cancelling_proposals = set()
+
+# The tasks that run in background are referenced here until they're done, otherwise they may be
+# garbage collected before finishing
+background_tasks = set()
+
+
+def run_in_background(coroutine):
+    """
+    Runs a coroutine that the reaction handler doesn't need to wait for (such as sending a DM), and
+    logs its error if it fails.
+    """
+    task = asyncio.create_task(coroutine)
+    background_tasks.add(task)
+    task.add_done_callback(on_background_task_done)
+
+
+def on_background_task_done(task):
+    background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error("An error occurred in a background task", exc_info=task.exception())
+
+
+async def enqueue_reaction(handler, payload):
+    """
+    Queues the reaction to be handled by the workers. If the queue is full, waits for a free slot
+    rather than dropping the reaction, because a lost vote (or a lost removal of a vote) would change
+    the result of the proposal.
+    """
+    if vote_queue.full():
+        logger.warning(
+            "The queue of reactions is full, waiting to queue the reaction: %s, channel=%s, message=%s, user=%s",
+            payload.event_type,
+            payload.channel_id,
+            payload.message_id,
+            payload.user_id,
+        )
+    await vote_queue.put((handler, payload))
+    logger.debug("Queued a reaction: %s, queue size=%d", payload.event_type, vote_queue.qsize())
+
+
+async def double_reaction(payload):
+    """
+    Adds the same reaction to the message (just for fun). The message isn't fetched, because adding a
+    reaction only needs its id.
+    """
+    channel = client.get_partial_messageable(payload.channel_id)
+    await channel.get_partial_message(payload.message_id).add_reaction(payload.emoji)
 
-async def is_valid_voting_reaction(payload):
-    logger.debug("Verifying the reaction...")
 
-    # Check if the reaction matches
-    if payload.emoji.name != CANCEL_EMOJI_UNICODE:
+async def vote_worker():
+    """
+    Handles the queued reactions one by one. The handlers report their own errors, so the exceptions
+    caught here are only logged, in order to keep the worker running.
+    """
+    while True:
+        handler, payload = await vote_queue.get()
+        try:
+            await handler(payload)
+        # asyncio.CancelledError isn't an Exception, so cancelling the worker still stops it
+        except Exception:
+            logger.critical(
+                "Unexpected error in %s while handling a reaction, channel=%s, message=%s, user=%s",
+                __name__,
+                payload.channel_id,
+                payload.message_id,
+                payload.user_id,
+                exc_info=True,
+            )
+        finally:
+            vote_queue.task_done()
+
+
+def is_voting_reaction(payload):
+    """
+    Checks whether the reaction is a vote on an active proposal in the voting channel. Only the payload
+    and the active proposals are used, so it's safe to call before anything is awaited.
+    """
+    return (
+        payload.emoji.name == CANCEL_EMOJI_UNICODE
+        and payload.channel_id == VOTING_CHANNEL_ID
+        and is_relevant_proposal(payload.message_id)
+    )
+
+
+def get_incorrect_reaction_proposal(payload):
+    """
+    When adding reaction, checks if the user has attempted to vote on a wrong message - either the original proposer message, or the bots reply to it, associated with an active proposal though (in order to help onboard new users). Returns the proposal, or None if that's not the case. Like is_voting_reaction, it's safe to call before anything is awaited.
+    """
+    if payload.emoji.name != CANCEL_EMOJI_UNICODE or payload.event_type != "REACTION_ADD":
+        return None
+    return get_proposal_initiated_by(payload.message_id)
+
+
+async def is_valid_voting_reaction(payload, skip_role_check=False):
+    """
+    Checks whether the reaction is a vote of a valid user on an active proposal. The role check can
+    be skipped when a reaction is removed, because the user must have had the role to add it.
+    """
+    # The message checks only use the payload and the active proposals, so they're performed before
+    # resolving the member and its roles (most reactions are not related to any proposal)
+    is_voting_message = is_voting_reaction(payload)
+    incorrect_reaction_proposal = (
+        None if is_voting_message else get_incorrect_reaction_proposal(payload)
+    )
+    if not is_voting_message and not incorrect_reaction_proposal:
         return False
-    logger.debug("Emoji is correct")
+
+    # Removing a reaction is only relevant for votes, so the helper message handling below isn't
+    # needed either
+    if skip_role_check and is_voting_message:
+        return True
 
     # Check if the user role matches
     guild = client.get_guild(payload.guild_id)
     member = guild.get_member(payload.user_id)
     if not await validate_roles(member):
+        logger.debug(
+            "Ignoring the reaction of a user without the required role, message=%s, user=%s",
+            payload.message_id,
+            payload.user_id,
+        )
         return False
-    logger.debug("Role is correct")
 
-    reaction_channel = guild.get_channel(payload.channel_id)
+    if incorrect_reaction_proposal:
+        reaction_channel = guild.get_channel(payload.channel_id)
 
-    # A hotfix for discord forums (the None channel is returned when a reaction is added to a message in a forum; though it works fine in other functions that use ctx.message.channel.id, such as propose)
-    if not reaction_channel:
-        logger.debug("Seems like a forum message.")
-        return
+        # A hotfix for discord forums (the None channel is returned when a reaction is added to a message in a forum; though it works fine in other functions that use ctx.message.channel.id, such as propose)
+        if not reaction_channel:
+            logger.debug("Seems like a forum message.")
+            return False
 
-    # When adding reaction, check if the user has attempted to vote on a wrong message - either the original proposer message, or the bots reply to it, associated with an active proposal though (in order to help onboard new users)
-    if payload.event_type == "REACTION_ADD":
-        incorrect_reaction_proposal = get_proposal_initiated_by(payload.message_id)
-        if incorrect_reaction_proposal:
-            # Remove reaction from the message (only in channels that are allowed for bot to manage messages/reactions), in order not to confuse other members
-            if reaction_channel.id in CHANNELS_TO_REMOVE_HELPER_MESSAGES_AND_REACTIONS:
-                reaction_message = await reaction_channel.fetch_message(payload.message_id)
-                await reaction_message.remove_reaction(payload.emoji, member)
-
-            # Retrieve the relevant voting message to send link to the user
-            voting_message = await get_message(
-                client, VOTING_CHANNEL_ID, incorrect_reaction_proposal.voting_message_id
-            )
-            # Send private message to user
-            dm_channel = await member.create_dm()
-            await dm_channel.send(
-                HELP_MESSAGE_VOTED_INCORRECTLY.format(voting_link=voting_message.jump_url)
+        # Remove reaction from the message (only in channels that are allowed for bot to manage messages/reactions), in order not to confuse other members
+        if reaction_channel.id in CHANNELS_TO_REMOVE_HELPER_MESSAGES_AND_REACTIONS:
+            # The message isn't fetched, because removing a reaction only needs its id
+            await reaction_channel.get_partial_message(payload.message_id).remove_reaction(
+                payload.emoji, member
             )
 
-    # Check if this is a voting channel
-    if reaction_channel.id != VOTING_CHANNEL_ID:
+        # Get the link to the relevant voting message to send it to the user (a partial message is
+        # enough for that, so it's not fetched)
+        voting_message = get_voting_channel().get_partial_message(
+            incorrect_reaction_proposal.voting_message_id
+        )
+        # Send private message to user
+        run_in_background(
+            member.send(HELP_MESSAGE_VOTED_INCORRECTLY.format(voting_link=voting_message.jump_url))
+        )
         return False
-    logger.debug("Channel is correct")
 
-    # Check if the reaction message is a relevant lazy consensus voting
-    if not is_relevant_proposal(payload.message_id):
-        return False
-    logger.debug("Proposal is correct")
     return True
 
 
 @client.event
 async def on_raw_reaction_remove(payload):
+    # Most reactions are not votes, so they're filtered out before being queued
+    if not is_voting_reaction(payload):
+        return
+    await enqueue_reaction(handle_reaction_remove, payload)
+
+
+async def handle_reaction_remove(payload):
     logger.debug("Removing a reaction: %s", payload.event_type)
     try:
-        # Check if the reaction was made by valid user to a valid voting message
-        if not await is_valid_voting_reaction(payload):
+        # Check if the reaction was made to a valid voting message (the role was already checked
+        # when the reaction was added)
+        if not await is_valid_voting_reaction(payload, skip_role_check=True):
             return
 
         # Get the proposal (it was already validated that it exists)
@@ -96,6 +241,11 @@ async def on_raw_reaction_remove(payload):
         # Error handling - retrieve the voter object from the DB
         voter = await get_voter(payload.user_id, payload.message_id)
         if not voter:
+            # The reactions of users who aren't allowed to vote are not counted, so the role is only
+            # checked here, in order not to warn about them
+            member = client.get_guild(payload.guild_id).get_member(payload.user_id)
+            if not await validate_roles(member):
+                return
             logger.warning(
                 "Warning: Unable to find in the DB a user whose voting reaction was presented on active proposal. channel=%s, message=%s, user=%s, proposal=%s",
                 payload.channel_id,
@@ -110,12 +260,13 @@ async def on_raw_reaction_remove(payload):
 
     except Exception as e:
         try:
-            # Try replying in Discord
-            message = await get_message(client, payload.channel_id, payload.message_id)
-            await message.reply(
-                f"An unexpected error occurred when handling reaction removal. cc {RESPONSIBLE_MENTION}"
+            # Try replying in Discord (the message isn't fetched, because it's only needed for reference)
+            await reply_to_message(
+                payload.channel_id,
+                payload.message_id,
+                f"An unexpected error occurred when handling reaction removal. cc {RESPONSIBLE_MENTION}",
             )
-        except Exception as e:
+        except discord.HTTPException:
             logger.critical("Unable to reply in the chat that a critical error has occurred.")
 
         logger.critical(
@@ -128,100 +279,128 @@ async def on_raw_reaction_remove(payload):
         )
 
 
-async def cancel_proposal(proposal, reason, voting_message):
-    # Extracting dynamic data to fill messages
-    # Don't remove unused variables because messages text may change
-    mention_author = proposal.author
-    description_of_proposal = proposal.description
-    list_of_voters = VOTERS_LIST_SEPARATOR.join(f"<@{voter.user_id}>" for voter in proposal.voters)
-    original_message = await get_message(client, proposal.channel_id, proposal.message_id)
-    link_to_voting_message = voting_message.jump_url
-    link_to_initial_proposer_message = original_message.jump_url if original_message else None
-    if not proposal.is_grantless:
-        mention_receiver = proposal.mention
-        amount_of_allocation = get_amount_to_print(proposal.amount)
-
-    # Filling the response messages with different arguments based on the reason of cancelling
-    if reason == ProposalResult.CANCELLED_BY_PROPOSER:
-        if proposal.is_grantless:
-            response_to_proposer = GRANTLESS_PROPOSAL_RESULT_PROPOSER_RESPONSE[reason].format(
-                author=mention_author
-            )
-        else:
-            response_to_proposer = GRANT_PROPOSAL_RESULT_PROPOSER_RESPONSE[reason].format(
-                author=mention_author
-            )
-        log_message = "(by the proposer)"
-    elif reason == ProposalResult.CANCELLED_BY_REACHING_THRESHOLD:
-        if proposal.is_grantless:
-            response_to_proposer = GRANTLESS_PROPOSAL_RESULT_PROPOSER_RESPONSE[reason].format(
-                author=mention_author,
-                threshold=LAZY_CONSENSUS_THRESHOLD,
-                voting_link=link_to_voting_message,
+async def cancel_proposal(proposal, reason, voting_message=None):
+    # Votes that are added at about the same time are committed together, so several of them may
+    # reach the threshold at once; the proposal is only cancelled by the first one. The check must
+    # be done before anything is awaited
+    if proposal.voting_message_id in cancelling_proposals or not is_relevant_proposal(
+        proposal.voting_message_id
+    ):
+        logger.debug(
+            "The proposal is already cancelled, voting_message_id=%d", proposal.voting_message_id
+        )
+        return
+    cancelling_proposals.add(proposal.voting_message_id)
+    try:
+        # The voting message is fetched here unless it was given by the caller (it's only needed
+        # when cancelling, so voting doesn't fetch it)
+        if voting_message is None:
+            original_message, voting_message = await asyncio.gather(
+                get_message(client, proposal.channel_id, proposal.message_id),
+                get_message(client, VOTING_CHANNEL_ID, proposal.voting_message_id),
             )
         else:
-            response_to_proposer = GRANT_PROPOSAL_RESULT_PROPOSER_RESPONSE[reason].format(
-                author=mention_author,
-                threshold=LAZY_CONSENSUS_THRESHOLD,
-                voting_link=link_to_voting_message,
-            )
-        log_message = "(by reaching threshold)"
-
-    if reason == ProposalResult.CANCELLED_BY_PROPOSER:
-        edit_in_voting_channel = PROPOSAL_CANCELLED_VOTING_CHANNEL[reason].format(
-            author=mention_author, link_to_original_message=link_to_initial_proposer_message
+            original_message = await get_message(client, proposal.channel_id, proposal.message_id)
+
+        # Extracting dynamic data to fill messages
+        # Don't remove unused variables because messages text may change
+        mention_author = proposal.author
+        description_of_proposal = proposal.description
+        # A list is joined rather than a generator, since str.join builds a list from it anyway
+        list_of_voters = VOTERS_LIST_SEPARATOR.join(
+            [f"<@{voter.user_id}>" for voter in proposal.voters]
+        )
+        link_to_voting_message = voting_message.jump_url
+        link_to_initial_proposer_message = original_message.jump_url if original_message else None
+        if not proposal.is_grantless:
+            mention_receiver = proposal.mention
+            amount_of_allocation = get_amount_to_print(proposal.amount)
+
+        # Filling the response messages based on the reason of cancelling (the templates of each
+        # reason are looked up in dicts, and str.format ignores the arguments that a template doesn't
+        # use)
+        proposer_responses = (
+            GRANTLESS_PROPOSAL_RESULT_PROPOSER_RESPONSE
+            if proposal.is_grantless
+            else GRANT_PROPOSAL_RESULT_PROPOSER_RESPONSE
+        )
+        response_to_proposer = proposer_responses[reason].format(
+            author=mention_author,
+            threshold=LAZY_CONSENSUS_THRESHOLD,
+            voting_link=link_to_voting_message,
         )
-    elif reason == ProposalResult.CANCELLED_BY_REACHING_THRESHOLD:
         edit_in_voting_channel = PROPOSAL_CANCELLED_VOTING_CHANNEL[reason].format(
+            author=mention_author,
             threshold=LAZY_CONSENSUS_THRESHOLD,
             voters_list=list_of_voters,
             link_to_original_message=link_to_initial_proposer_message,
         )
-
-    if original_message:
-        await original_message.add_reaction(REACTION_ON_PROPOSAL_CANCELLED)
-    # Reply in the original channel, unless it's not the voting channel itself (then not replying to avoid flooding)
-    if original_message and voting_message.channel.id != original_message.channel.id:
-        message = await original_message.reply(response_to_proposer)
-        # Remove embeds
-        await message.edit(suppress=True)
-    # Edit the proposal in the voting channel; suppress=True will remove embeds
-    await voting_message.edit(content=edit_in_voting_channel, suppress=True)
-
-    # Add history item for analytics
-    await db.add_proposals_history_item(proposal, reason)
-    logger.debug(
-        "Added history item, voting_message_id=%d, result=%s",
-        proposal.voting_message_id,
-        reason,
-    )
-    # Remove the proposal
-    await remove_proposal(proposal.voting_message_id, db)
-    logger.info(
-        "Cancelled %s %s. voting_message_id=%d",
-        "grantless proposal" if proposal.is_grantless else "proposal with a grant",
-        log_message,
-        proposal.voting_message_id,
-    )
+        log_message = CANCELLED_PROPOSAL_LOG_MESSAGES[reason]
+
+        # The requests below don't depend on each other, so they're run concurrently
+        # Edit the proposal in the voting channel; suppress=True will remove embeds
+        tasks = [voting_message.edit(content=edit_in_voting_channel, suppress=True)]
+        if original_message:
+            tasks.append(original_message.add_reaction(REACTION_ON_PROPOSAL_CANCELLED))
+        # Reply in the original channel, unless it's not the voting channel itself (then not replying to avoid flooding)
+        if original_message and voting_message.channel.id != original_message.channel.id:
+            # Embeds are suppressed when sending, instead of editing the message afterwards
+            tasks.append(original_message.reply(response_to_proposer, suppress_embeds=True))
+        # Add history item for analytics (the messages above have already been formatted, so it's
+        # safe to convert the proposal data meanwhile)
+        tasks.append(db.add_proposals_history_item(proposal, reason))
+
+        # A failed request doesn't prevent the others, nor removing the proposal
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    "An error occurred while cancelling the proposal, voting_message_id=%d",
+                    proposal.voting_message_id,
+                    exc_info=result,
+                )
+        logger.debug(
+            "Added history item, voting_message_id=%d, result=%s",
+            proposal.voting_message_id,
+            reason,
+        )
+        # Remove the proposal
+        await remove_proposal(proposal.voting_message_id, db)
+        logger.info(
+            "Cancelled %s %s. voting_message_id=%d",
+            "grantless proposal" if proposal.is_grantless else "proposal with a grant",
+            log_message,
+            proposal.voting_message_id,
+        )
+    finally:
+        cancelling_proposals.discard(proposal.voting_message_id)
 
 
 @client.event
 async def on_raw_reaction_add(payload):
+    # Ignore the reactions of the bot itself (e.g. the doubled hearts)
+    if payload.user_id == client.user.id:
+        return
+    # The heart emojis are doubled in background, in order not to hold the workers that handle votes
+    if payload.emoji.name in HEART_EMOJIS:
+        run_in_background(double_reaction(payload))
+        return
+    # Most reactions are not related to proposals, so they're filtered out before being queued
+    if not is_voting_reaction(payload) and not get_incorrect_reaction_proposal(payload):
+        return
+    await enqueue_reaction(handle_reaction_add, payload)
+
+
+async def handle_reaction_add(payload):
     """
     Cancel a grant proposal if a L3 member reacts with a :x: emoji to the original message or the confirmation message.
     Parameters:
         payload (discord.RawReactionActionEvent): The event containing data about the reaction.
     """
-
+    logger.debug("Adding a reaction: %s", payload.event_type)
     try:
-        logger.debug("Adding a reaction: %s", payload.event_type)
-
         # Check if it's a valid voting reaction
         if not await is_valid_voting_reaction(payload):
-            # If not, check if the reaction is a heart emoji, to double it (just for fun)
-            if payload.emoji.name in HEART_EMOJI_LIST:
-                message = await get_message(client, payload.channel_id, payload.message_id)
-                await message.add_reaction(payload.emoji)
             return
 
         # Don't allow to vote if recovery is in progress
@@ -230,13 +409,12 @@ async def on_raw_reaction_add(payload):
             member = guild.get_member(payload.user_id)
 
             # Replying in DM
-            dm_channel = await member.create_dm()
-            await dm_channel.send(VOTING_PAUSED_RECOVERY_RESPONSE)
+            run_in_background(member.send(VOTING_PAUSED_RECOVERY_RESPONSE))
 
             # Removing the reaction. Not checking for permissions to remove because they must be set
             # otherwise error should be thrown (this code should only run if the reaction was added
             # to the voting channel)
-            reaction_message = await get_message(client, payload.channel_id, payload.message_id)
+            reaction_message = get_voting_channel().get_partial_message(payload.message_id)
             await reaction_message.remove_reaction(payload.emoji, member)
 
             logger.info(
@@ -247,12 +425,12 @@ async def on_raw_reaction_add(payload):
 
         proposal = get_proposal(payload.message_id)
 
-        # The voting message is needed to format the replies of the bot later
-        voting_message = await get_message(client, payload.channel_id, payload.message_id)
+        # The voting message is only needed for the link in the replies of the bot, so it's not
+        # fetched (cancel_proposal fetches it in order to edit it)
+        voting_message = get_voting_channel().get_partial_message(payload.message_id)
 
         # Error/fraud handling - check if the user has already voted for this proposal
         voter = await get_voter(payload.user_id, payload.message_id)
-        logger.debug("Voter: %s", voter)
         if voter:
             logger.warning(
                 "Warning: Somehow the same user has managed to vote twice on the same proposal: channel=%s, message=%s, user=%s, proposal=%s, voter=%s",
@@ -263,7 +441,6 @@ async def on_raw_reaction_add(payload):
                 voter,
             )
             return
-        logger.debug("User hasn't voted before")
 
         # Add voter to DB and dict
         await add_voter(
@@ -280,39 +457,38 @@ async def on_raw_reaction_add(payload):
         #  Check whether the voter is the proposer himself, and then cancel the proposal
         if proposal.author == payload.member.mention:
             logger.debug("The proposer voted against, cancelling")
-            await cancel_proposal(proposal, ProposalResult.CANCELLED_BY_PROPOSER, voting_message)
+            await cancel_proposal(proposal, ProposalResult.CANCELLED_BY_PROPOSER)
             return
-        logger.debug("The proposer isn't the author of the proposal")
 
-        # Check if the threshold is reached
+        # Check if the threshold is reached (add_voter doesn't wait for the commit, so nothing is
+        # awaited between adding the vote and counting it; cancel_proposal cancels a proposal once
+        # anyway)
         if len(proposal.voters) >= proposal.threshold:
             logger.debug("Threshold is reached, cancelling")
-            await cancel_proposal(
-                proposal, ProposalResult.CANCELLED_BY_REACHING_THRESHOLD, voting_message
-            )
+            await cancel_proposal(proposal, ProposalResult.CANCELLED_BY_REACHING_THRESHOLD)
         # If not, DM user notifying that his vote was counted
         else:
-            await send_dm(
-                payload.guild_id,
-                payload.user_id,
-                HELP_MESSAGE_VOTED_AGAINST.format(
-                    author=proposal.author,
-                    countdown=get_discord_countdown_plus_delta(
-                        proposal.closed_at - datetime.utcnow()
+            run_in_background(
+                send_dm(
+                    payload.guild_id,
+                    payload.user_id,
+                    HELP_MESSAGE_VOTED_AGAINST.format(
+                        author=proposal.author,
+                        closed_at_timestamp=get_utc_timestamp(proposal.closed_at),
+                        cancel_emoji=CANCEL_EMOJI_UNICODE,
+                        voting_link=voting_message.jump_url,
                     ),
-                    cancel_emoji=CANCEL_EMOJI_UNICODE,
-                    voting_link=voting_message.jump_url,
-                ),
+                )
             )
     except Exception as e:
         try:
-            # Try replying in Discord
-            message = await get_message(client, payload.channel_id, payload.message_id)
-
-            await message.reply(
-                f"An unexpected error occurred when handling reaction adding. cc {RESPONSIBLE_MENTION}"
+            # Try replying in Discord (the message isn't fetched, because it's only needed for reference)
+            await reply_to_message(
+                payload.channel_id,
+                payload.message_id,
+                f"An unexpected error occurred when handling reaction adding. cc {RESPONSIBLE_MENTION}",
             )
-        except Exception as e:
+        except discord.HTTPException:
             logger.critical("Unable to reply in the chat that a critical error has occurred.")
 
         logger.critical(
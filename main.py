@@ -1,10 +1,9 @@
 import sys
 import traceback
-import logging
 import asyncio
 
 from bot.utils.db_utils import DBUtil
-from bot.config.logging_config import log_handler, console_handler, DEFAULT_LOG_LEVEL
+from bot.config.logging_config import get_logger
 from bot.utils.proposal_utils import (
     add_proposal,
     get_proposals_count,
@@ -30,10 +29,7 @@ from bot.transact import free_funding_transact_command
 from bot.vote import cancel_proposal, on_raw_reaction_add
 from bot.help import help
 
-logger = logging.getLogger(__name__)
-logger.setLevel(DEFAULT_LOG_LEVEL)
-logger.addHandler(log_handler)
-logger.addHandler(console_handler)
+logger = get_logger(__name__)
 
 
 async def sync_voters_db_with_discord(client, proposal):
@@ -130,7 +126,7 @@ async def start_proposals_coroutines(client, pending_grant_proposals):
     logger.info("Running approval of the proposals...")
 
     # Check if there are any pending proposals
-    if pending_grant_proposals.count() == 0:
+    if not pending_grant_proposals:
         logger.info("Hooray - no DB recovery is needed!")
         return
 